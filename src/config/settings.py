@@ -21,7 +21,11 @@ This module defines dataclasses for all configuration sections:
 """
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Literal, Any, TYPE_CHECKING
 
 
@@ -49,6 +53,43 @@ class UserConfig:  # UC-4.1 | PLAN-3.2
     organizations: list[str] = field(default_factory=list)  # empty = all orgs
 
 
+@lru_cache(maxsize=32)
+def _compile_repo_patterns(
+    patterns: tuple[str, ...]
+) -> tuple[frozenset[str], re.Pattern[str] | None]:  # UC-5.1 | PLAN-3.3
+    """
+    Split repo filter patterns into exact names and one compiled wildcard regex.
+
+    Exact names are checked with O(1) set membership; only patterns containing
+    fnmatch wildcards (*, ?, [) go through the regex.
+
+    Args:
+        patterns: Whitelist or blacklist patterns
+
+    Returns:
+        tuple: (frozenset of exact names, combined wildcard regex or None)
+    """
+    exact: set[str] = set()
+    wildcards: list[str] = []
+    for pattern in patterns:
+        pattern = os.path.normcase(pattern)
+        if any(c in pattern for c in "*?["):
+            wildcards.append(fnmatch.translate(pattern))
+        else:
+            exact.add(pattern)
+    regex = re.compile("|".join(wildcards)) if wildcards else None
+    return frozenset(exact), regex
+
+
+def _matches_any(
+    name: str,
+    compiled: tuple[frozenset[str], re.Pattern[str] | None]
+) -> bool:  # UC-5.1 | PLAN-3.3
+    """Check a (normcased) repo name against compiled filter patterns."""
+    exact, regex = compiled
+    return name in exact or (regex is not None and regex.match(name) is not None)
+
+
 @dataclass
 class RepositoryConfig:  # UC-5.1 | PLAN-3.3
     """
@@ -90,24 +131,16 @@ class RepositoryConfig:  # UC-5.1 | PLAN-3.3
         Returns:
             bool: True if repository should be included
         """
-        import fnmatch
-
-        full_name = repo.get("full_name", "")
+        full_name = os.path.normcase(repo.get("full_name", ""))
 
         # Check whitelist (if not empty) - supports wildcards
         if self.include:
-            matches_any = any(
-                fnmatch.fnmatch(full_name, pattern) for pattern in self.include
-            )
-            if not matches_any:
+            if not _matches_any(full_name, _compile_repo_patterns(tuple(self.include))):
                 return False
 
         # Check blacklist - supports wildcards
         if self.exclude:
-            matches_exclude = any(
-                fnmatch.fnmatch(full_name, pattern) for pattern in self.exclude
-            )
-            if matches_exclude:
+            if _matches_any(full_name, _compile_repo_patterns(tuple(self.exclude))):
                 return False
 
         # Check private filter
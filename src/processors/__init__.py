@@ -31,6 +31,7 @@ from .metrics import (
     EngagementMetrics,
     ProductivityPatterns,
     ReactionBreakdown,
+    MetricsBatch,
     create_metrics_calculator,
 )
 
@@ -45,5 +46,6 @@ __all__ = [
     "EngagementMetrics",
     "ProductivityPatterns",
     "ReactionBreakdown",
+    "MetricsBatch",
     "create_metrics_calculator",
 ]
@@ -87,6 +87,8 @@ class AggregatedData:  # UC-2.3 | PLAN-4.1
         Returns:
             dict: Summary statistics
         """
+        most_active_day, most_active_repo = self._get_most_active()
+
         return {
             "total_commits": self.total_commits,
             "total_prs_opened": self.total_prs_opened,
@@ -96,67 +98,42 @@ class AggregatedData:  # UC-2.3 | PLAN-4.1
             "total_issues_closed": self.total_issues_closed,
             "total_comments": self.total_comments,
             "repos_contributed_to": self.repos_contributed_to,
-            "most_active_day": self._get_most_active_day(),
-            "most_active_repo": self._get_most_active_repo(),
+            "most_active_day": most_active_day,
+            "most_active_repo": most_active_repo,
         }
 
-    def _get_most_active_day(self) -> str:  # UC-2.3 | PLAN-4.1
-        """Get the most active day by number of activities."""
-        days: Counter[str] = Counter()
-
-        for commit in self.commits:
-            date_str = (commit.get("date") or "")[:10]
-            if date_str:
-                days[date_str] += 1
-
-        for pr in self.pull_requests:
-            date_str = (pr.get("created_at") or "")[:10]
-            if date_str:
-                days[date_str] += 1
-
-        for issue in self.issues:
-            date_str = (issue.get("created_at") or "")[:10]
-            if date_str:
-                days[date_str] += 1
-
-        for review in self.reviews:
-            date_str = (review.get("submitted_at") or "")[:10]
-            if date_str:
-                days[date_str] += 1
-
-        for comment in self.comments:
-            date_str = (comment.get("created_at") or "")[:10]
-            if date_str:
-                days[date_str] += 1
-
-        if not days:
-            return ""
+    def _get_most_active(self) -> tuple[str, str]:  # UC-2.3 | PLAN-4.1
+        """
+        Get the most active day and repository in a single pass.
 
-        return days.most_common(1)[0][0]
+        Days count every activity type; repositories count commits,
+        PRs and issues.
 
-    def _get_most_active_repo(self) -> str:  # UC-2.3 | PLAN-4.1
-        """Get the most active repository."""
+        Returns:
+            tuple[str, str]: (most active day, most active repo), "" if none
+        """
+        days: Counter[str] = Counter()
         repos: Counter[str] = Counter()
 
-        for commit in self.commits:
-            repo = commit.get("repository", "")
-            if repo:
-                repos[repo] += 1
-
-        for pr in self.pull_requests:
-            repo = pr.get("repository", "")
-            if repo:
-                repos[repo] += 1
-
-        for issue in self.issues:
-            repo = issue.get("repository", "")
-            if repo:
-                repos[repo] += 1
-
-        if not repos:
-            return ""
-
-        return repos.most_common(1)[0][0]
+        for items, date_field, count_repo in (
+            (self.commits, "date", True),
+            (self.pull_requests, "created_at", True),
+            (self.issues, "created_at", True),
+            (self.reviews, "submitted_at", False),
+            (self.comments, "created_at", False),
+        ):
+            for item in items:
+                date_str = (item.get(date_field) or "")[:10]
+                if date_str:
+                    days[date_str] += 1
+                if count_repo:
+                    repo = item.get("repository", "")
+                    if repo:
+                        repos[repo] += 1
+
+        most_active_day = days.most_common(1)[0][0] if days else ""
+        most_active_repo = repos.most_common(1)[0][0] if repos else ""
+        return most_active_day, most_active_repo
 
 
 class DataAggregator:  # UC-2.3, UC-7.1 | PLAN-4.1
@@ -245,15 +222,15 @@ class DataAggregator:  # UC-2.3, UC-7.1 | PLAN-4.1
         Returns:
             list[dict]: Filtered items
         """
-        filtered: list[dict[str, Any]] = []
+        # ISO-8601 dates compare correctly as strings; compare the YYYY-MM-DD prefix
+        start_str = self.start_date.isoformat()
+        end_str = self.end_date.isoformat()
 
-        for item in items:
-            date_str = self._extract_date(item, date_field)
-            if date_str:
-                if self.start_date.isoformat() <= date_str <= self.end_date.isoformat():
-                    filtered.append(item)
-
-        return filtered
+        return [
+            item for item in items
+            if (date_value := item.get(date_field))
+            and start_str <= str(date_value)[:10] <= end_str
+        ]
 
     def _filter_prs_by_date(
         self,
@@ -272,41 +249,18 @@ class DataAggregator:  # UC-2.3, UC-7.1 | PLAN-4.1
         Returns:
             list[dict]: Filtered PRs
         """
-        filtered: list[dict[str, Any]] = []
+        start_str = self.start_date.isoformat()
+        end_str = self.end_date.isoformat()
 
-        for pr in pull_requests:
-            # Keep if has activity in period
-            if pr.get("has_period_activity"):
-                filtered.append(pr)
-                continue
-
-            # Otherwise check created_at
-            date_str = self._extract_date(pr, "created_at")
-            if date_str:
-                if self.start_date.isoformat() <= date_str <= self.end_date.isoformat():
-                    filtered.append(pr)
-
-        return filtered
-
-    def _extract_date(
-        self,
-        item: dict[str, Any],
-        date_field: str
-    ) -> str:  # UC-2.3 | PLAN-4.1
-        """
-        Extract date string from item.
-
-        Args:
-            item: Item dictionary
-            date_field: Name of the date field
-
-        Returns:
-            str: Date string (YYYY-MM-DD) or empty string
-        """
-        date_value = item.get(date_field, "")
-        if date_value:
-            return str(date_value)[:10]
-        return ""
+        return [
+            pr for pr in pull_requests
+            # Keep if has activity in period, otherwise check created_at
+            if pr.get("has_period_activity")
+            or (
+                (created_at := pr.get("created_at"))
+                and start_str <= str(created_at)[:10] <= end_str
+            )
+        ]
 
     def _collect_repositories(
         self,
@@ -364,42 +318,18 @@ class DataAggregator:  # UC-2.3, UC-7.1 | PLAN-4.1
         Returns:
             list[dict]: Activity per repository
         """
-        repo_stats: dict[str, dict[str, int]] = {}
-
-        # Initialize stats for all repos
-        for repo in data.repositories:
-            repo_stats[repo] = {
-                "commits": 0,
-                "prs": 0,
-                "issues": 0,
-                "reviews": 0,
-            }
-
-        # Count commits
-        for commit in data.commits:
-            repo = commit.get("repository", "")
-            if repo and repo in repo_stats:
-                repo_stats[repo]["commits"] += 1
-
-        # Count PRs
-        for pr in data.pull_requests:
-            repo = pr.get("repository", "")
-            if repo and repo in repo_stats:
-                repo_stats[repo]["prs"] += 1
-
-        # Count issues
-        for issue in data.issues:
-            repo = issue.get("repository", "")
-            if repo and repo in repo_stats:
-                repo_stats[repo]["issues"] += 1
-
-        # Count reviews
-        for review in data.reviews:
-            repo = review.get("repository", "")
-            if repo and repo in repo_stats:
-                repo_stats[repo]["reviews"] += 1
+        commit_counts = Counter(c.get("repository", "") for c in data.commits)
+        pr_counts = Counter(pr.get("repository", "") for pr in data.pull_requests)
+        issue_counts = Counter(i.get("repository", "") for i in data.issues)
+        review_counts = Counter(r.get("repository", "") for r in data.reviews)
 
         return [
-            {"name": name, **stats}
-            for name, stats in sorted(repo_stats.items())
+            {
+                "name": repo,
+                "commits": commit_counts[repo],
+                "prs": pr_counts[repo],
+                "issues": issue_counts[repo],
+                "reviews": review_counts[repo],
+            }
+            for repo in sorted(set(data.repositories))
         ]
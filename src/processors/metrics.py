@@ -35,18 +35,52 @@ Productivity Patterns (UC-7.1):
 Reaction Breakdown:
 - Count by reaction type
 - Most reacted content
+
+Cross-period rollups:
+- MetricsBatch: Column-oriented PRMetrics for several periods
 """
 # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7
 
 from __future__ import annotations
 
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from datetime import date, datetime
+from math import fsum
+from typing import TYPE_CHECKING, Any, Iterable
 
 if TYPE_CHECKING:
     from src.config.settings import MetricsConfig
 
+# MetricsConfig flags as bits of MetricsCalculator._flags  # UC-7.1 | PLAN-3.7.3
+_PR_METRICS = 1
+_REVIEW_METRICS = 2
+_ENGAGEMENT_METRICS = 4
+_PRODUCTIVITY_PATTERNS = 8
+_REACTION_BREAKDOWN = 16
+
+# Day names indexed by date.weekday()  # UC-7.1 | PLAN-3.7.1
+_WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# PRMetrics field order shared by to_record() and MetricsBatch  # UC-7.1 | PLAN-3.7.1
+_PR_FIELDS = (
+    "avg_commits_per_pr",
+    "avg_time_to_merge_hours",
+    "avg_time_to_first_review_hours",
+    "avg_review_iterations",
+    "prs_merged_without_changes",
+    "prs_with_requested_changes",
+)
+
 
 @dataclass
 class PRMetrics:  # UC-7.1 | PLAN-3.7.1
@@ -74,6 +108,58 @@ class PRMetrics:  # UC-7.1 | PLAN-3.7.1
             "prs_with_requested_changes": self.prs_with_requested_changes,
         }
 
+    def to_record(self) -> tuple[float, ...]:
+        """Convert to a flat tuple in MetricsBatch column order."""
+        return tuple(getattr(self, name) for name in _PR_FIELDS)
+
+
+@dataclass
+class MetricsBatch:  # UC-7.1 | PLAN-3.7.1
+    """
+    PR metrics for several periods, stored column by column.
+
+    Each PRMetrics field is kept in its own contiguous array of doubles,
+    so a cross-period rollup is one reduction over a single column instead
+    of a loop over PRMetrics objects.
+    """
+
+    columns: dict[str, array] = field(default_factory=lambda: {
+        name: array("d") for name in _PR_FIELDS
+    })
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[float, ...]]) -> MetricsBatch:
+        """
+        Build a batch from PRMetrics.to_record() tuples.
+
+        Args:
+            records: Tuples in PRMetrics field order
+
+        Returns:
+            MetricsBatch with one row per record
+        """
+        batch = cls()
+        for name, values in zip(_PR_FIELDS, zip(*records)):
+            batch.columns[name].extend(values)
+        return batch
+
+    def append(self, metrics: PRMetrics) -> None:
+        """Add one period's PRMetrics as a new row."""
+        for name, value in zip(_PR_FIELDS, metrics.to_record()):
+            self.columns[name].append(value)
+
+    def __len__(self) -> int:
+        return len(self.columns[_PR_FIELDS[0]])
+
+    def total(self, name: str) -> float:
+        """Sum of a column across all periods."""
+        return fsum(self.columns[name])
+
+    def mean(self, name: str) -> float:
+        """Mean of a column across all periods, 0.0 if empty."""
+        column = self.columns[name]
+        return fsum(column) / len(column) if column else 0.0
+
 
 @dataclass
 class ReviewMetrics:  # UC-7.1 | PLAN-3.7.1
@@ -125,15 +211,9 @@ class ProductivityPatterns:  # UC-7.1 | PLAN-3.7.1
     Productivity patterns by time of day and day of week.
     """
 
-    by_day: dict[str, int] = field(default_factory=lambda: {
-        "Monday": 0,
-        "Tuesday": 0,
-        "Wednesday": 0,
-        "Thursday": 0,
-        "Friday": 0,
-        "Saturday": 0,
-        "Sunday": 0,
-    })
+    by_day: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(_WEEKDAY_NAMES, 0)
+    )
     by_hour: dict[str, int] = field(default_factory=lambda: {
         str(h): 0 for h in range(24)
     })
@@ -174,6 +254,9 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
     Calculates all metrics defined in Plan Section 3.7 based on
     the configuration flags in MetricsConfig.
 
+    The config flags are folded into a bitmask once at construction, so
+    changes to the config afterwards are not picked up.
+
     Attributes:
         config: MetricsConfig with flags for each metric type
     """
@@ -186,6 +269,13 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
             config: MetricsConfig instance with metric calculation flags
         """
         self.config = config
+        self._flags = (
+            (_PR_METRICS if config.pr_metrics else 0)
+            | (_REVIEW_METRICS if config.review_metrics else 0)
+            | (_ENGAGEMENT_METRICS if config.engagement_metrics else 0)
+            | (_PRODUCTIVITY_PATTERNS if config.productivity_patterns else 0)
+            | (_REACTION_BREAKDOWN if config.reaction_breakdown else 0)
+        )
 
     def calculate_pr_metrics(
         self,
@@ -212,31 +302,32 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
         Returns:
             PRMetrics instance if pr_metrics enabled and prs exist, None otherwise
         """
-        if not self.config.pr_metrics or not prs:
+        if not self._flags & _PR_METRICS or not prs:
             return None
 
         metrics = PRMetrics()
 
-        # Calculate average commits per PR
-        total_commits = sum(pr.get("commits_count", pr.get("commits", 0)) for pr in prs)
-        metrics.avg_commits_per_pr = total_commits / len(prs)
-
-        # Calculate average time to merge
-        merge_times: list[float] = []
+        # Average commits per PR and time to merge in a single pass
+        # (merge time summed in seconds, converted once)
+        total_commits = 0
+        merge_seconds = 0.0
+        merged_count = 0
         for pr in prs:
+            total_commits += pr.get("commits_count", pr.get("commits", 0))
             merged_at = pr.get("merged_at")
             created_at = pr.get("created_at")
             if merged_at and created_at:
                 try:
                     created = self._parse_datetime(created_at)
                     merged = self._parse_datetime(merged_at)
-                    hours = (merged - created).total_seconds() / 3600
-                    merge_times.append(hours)
+                    merge_seconds += (merged - created).total_seconds()
+                    merged_count += 1
                 except (ValueError, TypeError):
                     pass
 
-        if merge_times:
-            metrics.avg_time_to_merge_hours = sum(merge_times) / len(merge_times)
+        metrics.avg_commits_per_pr = total_commits / len(prs)
+        if merged_count:
+            metrics.avg_time_to_merge_hours = merge_seconds / merged_count / 3600
 
         # Use reviews_on_authored_prs for first review time and changes requested
         # These are reviews FROM others ON the user's PRs
@@ -331,7 +422,7 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
         Returns:
             ReviewMetrics instance if review_metrics enabled and reviews exist
         """
-        if not self.config.review_metrics or not reviews:
+        if not self._flags & _REVIEW_METRICS or not reviews:
             return None
 
         metrics = ReviewMetrics()
@@ -345,14 +436,12 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
                 pr_key = f"{pr.get('repository', '')}#{pr.get('number', '')}"
                 prs_by_key[pr_key] = pr
 
-        for review in reviews:
-            # Count by state
-            state = review.get("state", "")
-            if state == "APPROVED":
-                metrics.approvals += 1
-            elif state == "CHANGES_REQUESTED":
-                metrics.changes_requested += 1
+        # Count by state
+        states = Counter(review.get("state", "") for review in reviews)
+        metrics.approvals = states["APPROVED"]
+        metrics.changes_requested = states["CHANGES_REQUESTED"]
 
+        for review in reviews:
             # Count reviews with comments
             body_length = review.get("body_length", 0)
             if body_length is None:
@@ -410,14 +499,20 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
         Returns:
             EngagementMetrics instance if engagement_metrics enabled
         """
-        if not self.config.engagement_metrics:
+        if not self._flags & _ENGAGEMENT_METRICS:
             return None
 
         metrics = EngagementMetrics()
 
+        # Activity counts are plain list lengths; compute them once
+        commit_count = len(commits)
+        comment_count = len(comments)
+        review_count = len(reviews) if reviews else 0
+        reaction_count = len(reactions) if reactions else 0
+
         # Calculate comment to code ratio
-        if commits:
-            metrics.comment_to_code_ratio = len(comments) / len(commits)
+        if commit_count:
+            metrics.comment_to_code_ratio = comment_count / commit_count
 
         # Calculate average response time
         # Group comments by issue/PR to find response times
@@ -454,10 +549,6 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
 
         # Calculate collaboration score
         # Weighted formula: reviews * 3 + comments * 1 + reactions * 0.5
-        review_count = len(reviews) if reviews else 0
-        comment_count = len(comments)
-        reaction_count = len(reactions) if reactions else 0
-
         metrics.collaboration_score = (
             review_count * 3.0 +
             comment_count * 1.0 +
@@ -483,41 +574,39 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
         Returns:
             ProductivityPatterns instance if productivity_patterns enabled
         """
-        if not self.config.productivity_patterns or not events:
+        if not self._flags & _PRODUCTIVITY_PATTERNS or not events:
             return None
 
         patterns = ProductivityPatterns()
 
+        # Fixed-size histograms indexed by weekday (0=Monday) and hour
+        day_counts = [0] * 7
+        hour_counts = [0] * 24
+
         for event in events:
             created_at = event.get("created_at")
             if not created_at:
                 continue
 
+            # ISO 8601 layout is fixed: read the date and hour fields by slice
+            # instead of building a full datetime (date-only strings count as hour 0)
             try:
-                dt = self._parse_datetime(created_at)
-                day_name = dt.strftime("%A")
-                hour = str(dt.hour)
-
-                if day_name in patterns.by_day:
-                    patterns.by_day[day_name] += 1
-                if hour in patterns.by_hour:
-                    patterns.by_hour[hour] += 1
+                weekday = date.fromisoformat(created_at[:10]).weekday()
+                hour = int(created_at[11:13]) if len(created_at) > 10 else 0
             except (ValueError, TypeError):
-                pass
-
-        # Find most active day and hour
-        if patterns.by_day:
-            patterns.most_active_day = max(
-                patterns.by_day.items(),
-                key=lambda x: x[1]
-            )[0]
-
-        if patterns.by_hour:
-            most_active_hour_str = max(
-                patterns.by_hour.items(),
-                key=lambda x: x[1]
-            )[0]
-            patterns.most_active_hour = int(most_active_hour_str)
+                continue
+            if not 0 <= hour < 24:
+                continue
+            day_counts[weekday] += 1
+            hour_counts[hour] += 1
+
+        patterns.by_day = dict(zip(_WEEKDAY_NAMES, day_counts))
+        patterns.by_hour = {str(hour): count for hour, count in enumerate(hour_counts)}
+
+        # Find most active day and hour (ties go to the earliest)
+        by_day = patterns.by_day
+        patterns.most_active_day = max(by_day, key=by_day.get)
+        patterns.most_active_hour = max(range(24), key=hour_counts.__getitem__)
 
         return patterns
 
@@ -534,19 +623,12 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
         Returns:
             ReactionBreakdown instance if reaction_breakdown enabled
         """
-        if not self.config.reaction_breakdown or not reactions:
+        if not self._flags & _REACTION_BREAKDOWN or not reactions:
             return None
 
-        breakdown = ReactionBreakdown()
+        counts = Counter(reaction.get("content", "unknown") for reaction in reactions)
 
-        for reaction in reactions:
-            content = reaction.get("content", "unknown")
-            if content not in breakdown.counts:
-                breakdown.counts[content] = 0
-            breakdown.counts[content] += 1
-            breakdown.total += 1
-
-        return breakdown
+        return ReactionBreakdown(counts=dict(counts), total=len(reactions))
 
     def calculate_all(
         self,
@@ -631,6 +713,15 @@ class MetricsCalculator:  # UC-7.1, UC-7.1, UC-7.1 | PLAN-3.7.3
         if dt_string.endswith("Z"):
             dt_string = dt_string[:-1]
 
+        # Fast path: C-implemented ISO parser (naive results only, matching
+        # the strptime formats below)
+        try:
+            parsed = datetime.fromisoformat(dt_string[:26])
+            if parsed.tzinfo is None:
+                return parsed
+        except ValueError:
+            pass
+
         # Try parsing with and without microseconds
         for fmt in (
             "%Y-%m-%dT%H:%M:%S.%f",
@@ -9,10 +9,12 @@ Report Schema Validator.  # UC-12.1 | PLAN-3.11
 This module validates JSON reports against the schema:
 - Loads schema from src/config/schema.json
 - Validates report structure using jsonschema library
+- Accepts valid reports via fastjsonschema when installed (optional speedup)
 - Returns validation errors with helpful messages
 
 Classes:
-- ReportValidator: Main validator class with validate() and validate_file() methods
+- ReportValidator: Main validator class with validate(), validate_with_index(),
+  validate_file() and validate_bytes() methods
 
 Functions:
 - validate_report(report_data): Convenience function for validation
@@ -28,6 +30,7 @@ Validation checks:
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -38,12 +41,104 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+# Default schema location, resolved once at import  # UC-12.1 | PLAN-3.11
+_DEFAULT_SCHEMA_PATH = Path(__file__).resolve().parent.parent / "config" / "schema.json"
+
+
+@lru_cache(maxsize=32)
+def _load_schema(path_str: str, mtime_ns: int) -> dict[str, Any]:  # UC-12.1 | PLAN-3.11
+    """
+    Read and parse a schema file, shared across ReportValidator instances.
+
+    Keyed by resolved path and modification time so edited schemas are
+    re-read. The returned dict is shared and must not be mutated.
+
+    Args:
+        path_str: Resolved schema file path
+        mtime_ns: Schema file modification time in nanoseconds
+
+    Returns:
+        dict: The JSON schema dictionary
+    """
+    with open(path_str, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=32)
+def _get_cached_validator(path_str: str, mtime_ns: int) -> Draft7Validator:  # UC-12.1 | PLAN-3.11
+    """
+    Get a compiled Draft7Validator for a schema file.
+
+    Args:
+        path_str: Resolved schema file path
+        mtime_ns: Schema file modification time in nanoseconds
+
+    Returns:
+        Draft7Validator: Validator shared by all instances using this schema
+    """
+    return Draft7Validator(_load_schema(path_str, mtime_ns))
+
+
+def _compile_fast_validator(schema: dict[str, Any]) -> Any:  # UC-12.1 | PLAN-3.11
+    """
+    Compile a schema with fastjsonschema for the valid-report fast path.
+
+    Defaults are not injected (the report must not be modified) and formats
+    are not checked, matching Draft7Validator without a format checker.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Compiled validation function, or None if fastjsonschema is not
+        installed or does not support the schema
+    """
+    if not HAS_FASTJSONSCHEMA:
+        return None
+    try:
+        return fastjsonschema.compile(
+            schema, use_default=False, use_formats=False, detailed_exceptions=False
+        )
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _get_cached_fast_validator(path_str: str, mtime_ns: int) -> Any:  # UC-12.1 | PLAN-3.11
+    """
+    Get the compiled fastjsonschema function for a schema file.
+
+    Args:
+        path_str: Resolved schema file path
+        mtime_ns: Schema file modification time in nanoseconds
+
+    Returns:
+        Compiled validation function, or None if unavailable
+    """
+    return _compile_fast_validator(_load_schema(path_str, mtime_ns))
+
 
 class ReportValidator:  # UC-12.1 | PLAN-3.11
     """
     Validate reports against JSON schema.
 
-    Uses the jsonschema library for comprehensive validation.
+    Uses the jsonschema library for comprehensive validation. When
+    fastjsonschema is installed, valid reports are accepted by a compiled
+    validator first and only invalid ones go through jsonschema. The schema is
+    loaded and its Draft7Validator built when the validator is created, and
+    both are shared between instances using the same unchanged schema file.
     Falls back to basic validation if jsonschema is not installed.
 
     Attributes:
@@ -65,12 +160,42 @@ class ReportValidator:  # UC-12.1 | PLAN-3.11
             schema_path: Path to JSON schema file. If None, uses default location.
         """
         if schema_path is None:
-            # Default schema location
-            schema_path = Path(__file__).parent.parent / "config" / "schema.json"
-
-        self.schema_path = Path(schema_path)
+            # Default schema location (already resolved)
+            self.schema_path = _DEFAULT_SCHEMA_PATH
+            resolved = _DEFAULT_SCHEMA_PATH
+        else:
+            self.schema_path = Path(schema_path)
+            resolved = None
         self._schema: dict[str, Any] | None = None
 
+        # Schema files are parsed and compiled once per (path, mtime) and
+        # shared; the fallback schema is compiled per instance
+        try:
+            schema_key = (
+                str(resolved or self.schema_path.resolve()),
+                self.schema_path.stat().st_mtime_ns,
+            )
+        except OSError:
+            schema_key = None
+
+        if schema_key is not None:
+            self._schema = _load_schema(*schema_key)
+
+        self._validator = None
+        if HAS_JSONSCHEMA:
+            if schema_key is not None:
+                self._validator = _get_cached_validator(*schema_key)
+            else:
+                self._validator = Draft7Validator(self.schema)
+
+        if schema_key is not None:
+            self._fast_validate = _get_cached_fast_validator(*schema_key)
+        else:
+            self._fast_validate = _compile_fast_validator(self.schema)
+
+        # Top-level sections checked before any schema walk
+        self._top_required: tuple[str, ...] = tuple(self.schema.get("required", ()))
+
     @property
     def schema(self) -> dict[str, Any]:  # UC-12.1 | PLAN-3.11
         """
@@ -157,14 +282,63 @@ class ReportValidator:  # UC-12.1 | PLAN-3.11
             >>> is_valid, errors = validator.validate({"metadata": {}, "summary": {}})
             >>> print(is_valid)  # False - missing required fields
         """
-        errors: list[str] = []
+        is_valid, errors, _ = self.validate_with_index(report_data)
+        return (is_valid, errors)
+
+    def validate_with_index(
+        self,
+        report_data: dict[str, Any]
+    ) -> tuple[bool, list[str], dict[str, list[str]]]:  # UC-12.1 | PLAN-3.11
+        """
+        Validate report and index the error messages by field path.
+
+        Index keys are dotted field paths (e.g. "metadata.period.year"). A
+        missing required field is keyed by its own path, e.g.
+        "metadata.user.login". Errors that cannot be tied to a field, and
+        all errors from the basic validator used without jsonschema, are
+        keyed by "(root)".
+
+        Args:
+            report_data: Report dictionary to validate
+
+        Returns:
+            tuple: (is_valid, list of error messages, errors by field path)
+
+        Example:
+            >>> validator = ReportValidator()
+            >>> is_valid, errors, index = validator.validate_with_index({"metadata": {}})
+            >>> "summary" in index
+            True
+        """
+        index: dict[str, list[str]] = {}
+
+        # Missing top-level sections are reported directly, without walking
+        # the schema for the sections that are present
+        if isinstance(report_data, dict):
+            for key in self._top_required:
+                if key not in report_data:
+                    index[key] = [f"Missing required field '{key}' at (root)"]
+            if index:
+                return (False, [e for msgs in index.values() for e in msgs], index)
+
+        # Fast path: a generated validator accepts valid reports without
+        # walking the schema; failures are re-checked below for full messages
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(report_data)
+                return (True, [], index)
+            except fastjsonschema.JsonSchemaException:
+                pass
 
         if HAS_JSONSCHEMA:
-            errors = self._validate_with_jsonschema(report_data)
+            index = self._validate_with_jsonschema(report_data)
         else:
             errors = self._validate_basic(report_data)
+            if errors:
+                index["(root)"] = errors
 
-        return (len(errors) == 0, errors)
+        errors = [e for msgs in index.values() for e in msgs]
+        return (len(errors) == 0, errors, index)
 
     def validate_file(
         self,
@@ -193,41 +367,74 @@ class ReportValidator:  # UC-12.1 | PLAN-3.11
             return (False, [f"File must be a JSON file: {file_path}"])
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                report_data = json.load(f)
-        except json.JSONDecodeError as e:
-            return (False, [f"Invalid JSON: {e}"])
+            raw = file_path.read_bytes()
         except IOError as e:
             return (False, [f"Could not read file: {e}"])
 
+        return self.validate_bytes(raw)
+
+    def validate_bytes(
+        self,
+        raw: bytes | str
+    ) -> tuple[bool, list[str]]:  # UC-12.1 | PLAN-3.11
+        """
+        Validate a serialized JSON report.
+
+        Parses with orjson when installed, stdlib json otherwise.
+
+        Args:
+            raw: UTF-8 encoded JSON report
+
+        Returns:
+            tuple[bool, list[str]]: (is_valid, list of error messages)
+        """
+        try:
+            report_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        except ValueError as e:  # Includes JSONDecodeError and bad UTF-8
+            return (False, [f"Invalid JSON: {e}"])
+
         return self.validate(report_data)
 
     def _validate_with_jsonschema(
         self,
         report_data: dict[str, Any]
-    ) -> list[str]:  # UC-12.1 | PLAN-3.11
+    ) -> dict[str, list[str]]:  # UC-12.1 | PLAN-3.11
         """
         Validate using jsonschema library.
 
         Provides detailed error messages with path information.
+
+        Returns:
+            dict[str, list[str]]: Error messages keyed by dotted field path
         """
-        errors: list[str] = []
+        index: dict[str, list[str]] = {}
 
         try:
-            # Use Draft7Validator for better error messages
-            validator = Draft7Validator(self.schema)
-
             # Collect all errors, not just the first one
-            for error in sorted(validator.iter_errors(report_data), key=lambda e: str(e.path)):
+            for error in sorted(self._validator.iter_errors(report_data), key=lambda e: str(e.path)):
                 # Build helpful error message
                 path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "(root)"
+
+                if error.validator == "required" and isinstance(error.instance, dict):
+                    # jsonschema raises one error per missing field without
+                    # naming it; key each missing field by its own path
+                    for name in error.validator_value:
+                        if name in error.instance:
+                            continue
+                        key = f"{path}.{name}" if error.absolute_path else name
+                        message = f"Missing required field '{name}' at {path}"
+                        messages = index.setdefault(key, [])
+                        if message not in messages:
+                            messages.append(message)
+                    continue
+
                 message = self._format_error_message(error, path)
-                errors.append(message)
+                index.setdefault(path, []).append(message)
 
         except SchemaError as e:
-            errors.append(f"Schema error: {e.message}")
+            index.setdefault("(root)", []).append(f"Schema error: {e.message}")
 
-        return errors
+        return index
 
     def _format_error_message(
         self,
@@ -39,6 +39,7 @@ from .date_utils import (
     parse_period,
     format_period,
     is_within_range,
+    is_within_range_ordinals,
     parse_iso_datetime,
     parse_iso_date,
 )
@@ -86,6 +87,7 @@ __all__ = [
     "parse_period",
     "format_period",
     "is_within_range",
+    "is_within_range_ordinals",
     "parse_iso_datetime",
     "parse_iso_date",
     # File utilities
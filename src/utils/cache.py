@@ -13,6 +13,8 @@ Cache features (UC-8.1 | PLAN-3.5):
 - TTL-based expiration (configurable via cache.ttl_hours)
 - Cache key = hash of request parameters
 - Automatic cleanup of expired entries
+- Uses orjson for (de)serialization when installed, stdlib json otherwise
+- In-memory LRU mirror of recently used entries (skips re-reading files)
 - Can be disabled via cache.enabled or --no-cache CLI flag
 
 Cache class methods:
@@ -37,13 +39,23 @@ from __future__ import annotations
 import hashlib
 import json
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 if TYPE_CHECKING:
     from src.config.settings import CacheConfig
 
+# Maximum number of entries kept in the in-memory mirror  # UC-8.1 | PLAN-3.5
+MEMORY_CACHE_SIZE = 256
+
 
 class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
     """
@@ -57,6 +69,11 @@ class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
     - directory: Where cache files are stored
     - ttl_hours: How long cache entries remain valid
 
+    Recently read or written entries are mirrored in a small in-memory LRU,
+    keyed by the cache file's mtime and size so that entries changed or
+    removed on disk are never served stale. Values returned from the mirror
+    are shared objects and must be treated as read-only.
+
     Attributes:
         config: CacheConfig with enabled, directory, ttl_hours settings
         cache_dir: Path to cache directory
@@ -71,6 +88,8 @@ class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
         """
         self.config = config  # UC-8.1 | PLAN-3.5 - use configured settings
         self.cache_dir = Path(config.directory)
+        # key -> ((mtime_ns, size), data)  # UC-8.1 | PLAN-3.5
+        self._mem: OrderedDict[str, tuple[tuple[int, int], dict | list]] = OrderedDict()
         if config.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -100,32 +119,47 @@ class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
             return None
 
         cache_file = self._get_cache_path(key)
-        if not cache_file.exists():
+        try:
+            stat = cache_file.stat()
+        except OSError:
+            self._mem.pop(key, None)
             return None
 
         # Check TTL using file modification time  # UC-8.1 | PLAN-3.5 - use configured ttl_hours
-        mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
+        mtime = datetime.fromtimestamp(stat.st_mtime)
         ttl_seconds = self.config.ttl_hours * 3600
 
         if datetime.now() - mtime > timedelta(seconds=ttl_seconds):
             # Cache expired, remove file
+            self._mem.pop(key, None)
             try:
                 cache_file.unlink()
             except OSError:
                 pass
             return None
 
+        # Serve from memory if the file is unchanged since it was mirrored
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._mem.get(key)
+        if entry is not None and entry[0] == signature:
+            self._mem.move_to_end(key)
+            return entry[1]
+
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
+            raw = cache_file.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        except (ValueError, OSError):
             # Invalid cache file, remove it
+            self._mem.pop(key, None)
             try:
                 cache_file.unlink()
             except OSError:
                 pass
             return None
 
+        self._remember(key, signature, data)
+        return data
+
     def set(self, key: str, data: dict | list) -> None:  # UC-8.1, UC-8.1 | PLAN-3.5
         """
         Store response in cache.
@@ -144,11 +178,20 @@ class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
         try:
             # Ensure cache directory exists  # UC-8.1 | PLAN-3.5 - use configured directory
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if HAS_ORJSON:
+                cache_file.write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(cache_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+            stat = cache_file.stat()
         except (OSError, TypeError) as e:
             # Log error but don't fail - caching is best-effort
-            pass
+            self._mem.pop(key, None)
+            return
+
+        self._remember(key, (stat.st_mtime_ns, stat.st_size), data)
 
     def delete(self, key: str) -> bool:  # UC-8.1, UC-8.1 | PLAN-3.5
         """
@@ -163,6 +206,7 @@ class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
         if not self.config.enabled:
             return False
 
+        self._mem.pop(key, None)
         cache_file = self._get_cache_path(key)
         if cache_file.exists():
             try:
@@ -179,6 +223,7 @@ class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
         Returns:
             Number of cache files deleted
         """
+        self._mem.clear()
         if not self.config.enabled or not self.cache_dir.exists():
             return 0
 
@@ -240,6 +285,25 @@ class ResponseCache:  # UC-8.1, UC-8.1 | PLAN-3.5
                 pass
         return count
 
+    def _remember(
+        self,
+        key: str,
+        signature: tuple[int, int],
+        data: dict | list
+    ) -> None:  # UC-8.1 | PLAN-3.5
+        """
+        Store an entry in the in-memory mirror, evicting the least recently used.
+
+        Args:
+            key: Cache key
+            signature: (mtime_ns, size) of the backing cache file
+            data: Cached data
+        """
+        self._mem[key] = (signature, data)
+        self._mem.move_to_end(key)
+        while len(self._mem) > MEMORY_CACHE_SIZE:
+            self._mem.popitem(last=False)
+
     def _get_cache_path(self, key: str) -> Path:  # UC-8.1, UC-8.1 | PLAN-3.5
         """
         Get cache file path for a key.
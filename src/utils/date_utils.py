@@ -15,6 +15,8 @@ Functions:
 - get_current_quarter(): Get current quarter (1-4)
 - get_current_month(): Get current month (1-12)
 - get_current_year(): Get current year
+- is_within_range(): Check if a date falls within a range
+- is_within_range_ordinals(): Same check on precomputed date ordinals
 
 Quarter date ranges (UC-3.1 | PLAN-3.1):
 - Q1: Jan 1 - Mar 31
@@ -24,10 +26,29 @@ Quarter date ranges (UC-3.1 | PLAN-3.1):
 """
 from __future__ import annotations
 
-from calendar import monthrange
+import re
 from datetime import date, datetime, timedelta
 from typing import Literal, Iterator
 
+# Period string shapes: "2024-12" (monthly) or "2024-Q4" (quarterly)  # UC-3.1 | PLAN-3.1
+_PERIOD_RE = re.compile(r"^(\d{4})-(?:Q(\d+)|(\d{1,2}))$")
+
+# Last day of each month in a non-leap year  # UC-3.1 | PLAN-3.1
+_MONTH_LAST = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# (start_month, start_day, end_month, end_day) per quarter  # UC-3.1 | PLAN-3.1
+_QUARTER_BOUNDS = (
+    (1, 1, 3, 31),
+    (4, 1, 6, 30),
+    (7, 1, 9, 30),
+    (10, 1, 12, 31),
+)
+
+
+def _is_leap(year: int) -> bool:  # UC-3.1 | PLAN-3.1
+    """Return True if year is a Gregorian leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
 
 def get_current_quarter() -> int:  # UC-3.1 | PLAN-3.1
     """
@@ -88,7 +109,10 @@ def get_period_range(
     if period_type == "monthly":  # UC-3.1 | PLAN-3.1
         if not 1 <= period_value <= 12:
             raise ValueError(f"Month must be 1-12, got {period_value}")
-        _, last_day = monthrange(year, period_value)
+        if period_value == 2 and _is_leap(year):
+            last_day = 29
+        else:
+            last_day = _MONTH_LAST[period_value - 1]
         return (
             date(year, period_value, 1),
             date(year, period_value, last_day)
@@ -96,13 +120,11 @@ def get_period_range(
     else:  # quarterly  # UC-3.1 | PLAN-3.1
         if not 1 <= period_value <= 4:
             raise ValueError(f"Quarter must be 1-4, got {period_value}")
-        quarters = {
-            1: (date(year, 1, 1), date(year, 3, 31)),
-            2: (date(year, 4, 1), date(year, 6, 30)),
-            3: (date(year, 7, 1), date(year, 9, 30)),
-            4: (date(year, 10, 1), date(year, 12, 31)),
-        }
-        return quarters[period_value]
+        start_month, start_day, end_month, end_day = _QUARTER_BOUNDS[period_value - 1]
+        return (
+            date(year, start_month, start_day),
+            date(year, end_month, end_day)
+        )
 
 
 def get_period_dates_str(
@@ -168,26 +190,23 @@ def parse_period(period_str: str) -> tuple[int, str, int]:  # UC-3.1 | PLAN-3.1
         >>> parse_period("2024-Q4")
         (2024, "quarterly", 4)
     """
-    if "-Q" in period_str:
+    match = _PERIOD_RE.match(period_str)
+    if not match:
+        raise ValueError(f"Invalid period format: {period_str}")
+
+    year = int(match.group(1))
+    if match.group(2) is not None:
         # Quarterly format: 2024-Q4
-        parts = period_str.split("-Q")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid quarterly period format: {period_str}")
-        year = int(parts[0])
-        quarter = int(parts[1])
+        quarter = int(match.group(2))
         if not 1 <= quarter <= 4:
             raise ValueError(f"Quarter must be 1-4, got {quarter}")
         return (year, "quarterly", quarter)
-    else:
-        # Monthly format: 2024-12
-        parts = period_str.split("-")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid monthly period format: {period_str}")
-        year = int(parts[0])
-        month = int(parts[1])
-        if not 1 <= month <= 12:
-            raise ValueError(f"Month must be 1-12, got {month}")
-        return (year, "monthly", month)
+
+    # Monthly format: 2024-12
+    month = int(match.group(3))
+    if not 1 <= month <= 12:
+        raise ValueError(f"Month must be 1-12, got {month}")
+    return (year, "monthly", month)
 
 
 def format_period(
@@ -233,13 +252,40 @@ def is_within_range(
             check_date = date.fromisoformat(check_date[:10])
         except (ValueError, TypeError):
             return False
-    return start_date <= check_date <= end_date
+    return is_within_range_ordinals(
+        check_date.toordinal(), start_date.toordinal(), end_date.toordinal()
+    )
+
+
+def is_within_range_ordinals(
+    check_ordinal: int,
+    start_ordinal: int,
+    end_ordinal: int
+) -> bool:  # UC-2.3 | PLAN-4.1
+    """
+    Check if a proleptic Gregorian ordinal is within a range.
+
+    Variant of is_within_range() for loops over many dates: convert the
+    range bounds with date.toordinal() once and compare plain integers.
+
+    Args:
+        check_ordinal: Ordinal of the date to check
+        start_ordinal: Ordinal of the range start
+        end_ordinal: Ordinal of the range end
+
+    Returns:
+        bool: True if ordinal is within range (inclusive)
+    """
+    return start_ordinal <= check_ordinal <= end_ordinal
 
 
 def parse_iso_datetime(dt_str: str | None) -> datetime | None:  # UC-2.3 | PLAN-4.1
     """
     Parse ISO datetime string to datetime object.
 
+    Any timezone offset is discarded and the wall-clock time is returned
+    as a naive datetime.
+
     Args:
         dt_str: ISO datetime string (e.g., "2024-12-01T12:00:00Z")
 
@@ -249,14 +295,14 @@ def parse_iso_datetime(dt_str: str | None) -> datetime | None:  # UC-2.3 | PLAN-
     if not dt_str:
         return None
     try:
-        # Handle Z suffix
-        dt_str = dt_str.rstrip("Z")
-        # Handle timezone offset
-        if "+" in dt_str:
-            dt_str = dt_str.split("+")[0]
-        return datetime.fromisoformat(dt_str)
+        # Handle Z suffix (fromisoformat only accepts it from Python 3.11)
+        if dt_str[-1] == "Z":
+            dt_str = dt_str[:-1]
+        dt = datetime.fromisoformat(dt_str)
     except (ValueError, TypeError):
         return None
+    # Drop any timezone offset; callers work with naive timestamps
+    return dt.replace(tzinfo=None) if dt.tzinfo is not None else dt
 
 
 def parse_iso_date(date_str: str | None) -> date | None:  # UC-2.3 | PLAN-4.1
@@ -269,9 +315,10 @@ def parse_iso_date(date_str: str | None) -> date | None:  # UC-2.3 | PLAN-4.1
     Returns:
         date | None: Parsed date or None if invalid
     """
-    if not date_str:
+    # Only the leading YYYY-MM-DD is needed; shorter or non-string input is invalid
+    if not isinstance(date_str, str) or len(date_str) < 10:
         return None
     try:
-        return date.fromisoformat(date_str[:10])
-    except (ValueError, TypeError):
+        return date.fromisoformat(date_str if len(date_str) == 10 else date_str[:10])
+    except ValueError:
         return None
@@ -26,14 +26,39 @@ reports/
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson options matching json.dumps(indent=2, default=str)  # UC-2.4 | PLAN-3.6
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+# Directories already created/verified by ensure_dir in this process  # UC-2.4 | PLAN-3.6
+_ENSURED_DIRS: set[str] = set()
+
 
 def ensure_dir(dir_path: Path | str) -> Path:  # UC-2.4 | PLAN-3.6
     """
     Ensure directory exists, creating if necessary.
 
+    Directories are remembered once ensured, so repeated calls for the
+    same path skip the mkdir syscalls. safe_write() recovers if a
+    remembered directory has since been removed.
+
     Args:
         dir_path: Path to directory
 
@@ -41,12 +66,24 @@ def ensure_dir(dir_path: Path | str) -> Path:  # UC-2.4 | PLAN-3.6
         Path: The directory path
     """
     path = Path(dir_path)
-    path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir_str(str(path))
     return path
 
 
+def _ensure_dir_str(dir_path: str) -> None:  # UC-2.4 | PLAN-3.6
+    """
+    ensure_dir() for a plain string path, without building a Path.
+
+    Args:
+        dir_path: Normalized directory path string
+    """
+    if dir_path not in _ENSURED_DIRS:
+        os.makedirs(dir_path, exist_ok=True)
+        _ENSURED_DIRS.add(dir_path)
+
+
 def get_next_version(
-    base_dir: Path,
+    base_dir: Path | str,
     prefix: str,
     extension: str
 ) -> int:  # UC-2.4 | PLAN-3.6
@@ -61,20 +98,50 @@ def get_next_version(
     Returns:
         int: Next version number (1 if no existing files)
     """
-    pattern = f"{prefix}-*.{extension}"
-    existing = sorted(base_dir.glob(pattern))
-
-    if not existing:
-        return 1
+    head = f"{prefix}-"
+    tail = f".{extension}"
+    min_len = len(head) + len(tail)
+    last_num = 0
 
-    # Extract last number and increment
-    last_file = existing[-1]
     try:
-        last_num = int(last_file.stem.split("-")[-1])
-        return last_num + 1
-    except (ValueError, IndexError):
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if len(name) > min_len and name.startswith(head) and name.endswith(tail):
+                    try:
+                        num = int(name[len(head):-len(tail)])
+                    except ValueError:
+                        continue
+                    if num > last_num:
+                        last_num = num
+    except FileNotFoundError:
         return 1
 
+    # Highest existing number + 1 (compared numerically, so 10 follows 9)
+    return last_num + 1
+
+
+@lru_cache(maxsize=128)
+def _period_tag(
+    year: int,
+    period_type: Literal["monthly", "quarterly"],
+    period_value: int
+) -> str:  # UC-2.4 | PLAN-3.6
+    """
+    Get the period part of a report filename.
+
+    Args:
+        year: Report year
+        period_type: "monthly" or "quarterly"
+        period_value: Month (1-12) or quarter (1-4)
+
+    Returns:
+        str: "{year}-{MM}" for monthly or "{year}-Q{Q}" for quarterly
+    """
+    if period_type == "monthly":
+        return f"{year}-{period_value:02d}"
+    return f"{year}-Q{period_value}"
+
 
 def get_next_filename(
     base_dir: Path | str,
@@ -105,25 +172,20 @@ def get_next_filename(
     Returns:
         Path: Full path to next available filename
     """
-    base_dir = Path(base_dir)
-
     # Build output directory: reports/{year}/{username}/ or reports/{year}/
+    # Work with plain strings and only build a Path for the result
     if username:
-        output_dir = base_dir / str(year) / username
+        output_dir = os.path.join(os.fspath(base_dir), str(year), username)
     else:
-        output_dir = base_dir / str(year)
-    ensure_dir(output_dir)
+        output_dir = os.path.join(os.fspath(base_dir), str(year))
+    _ensure_dir_str(os.path.normpath(output_dir))
 
-    # Build prefix
-    if period_type == "monthly":
-        prefix = f"{year}-{period_value:02d}-github-activity"
-    else:
-        prefix = f"{year}-Q{period_value}-github-activity"
+    prefix = f"{_period_tag(year, period_type, period_value)}-github-activity"
 
     # Get next version
     version = get_next_version(output_dir, prefix, extension)
 
-    return output_dir / f"{prefix}-{version}.{extension}"
+    return Path(output_dir, f"{prefix}-{version}.{extension}")
 
 
 def safe_write(
@@ -135,7 +197,8 @@ def safe_write(
     Safely write content to file.
 
     Creates parent directories if needed.
-    Handles both string content and JSON dictionaries.
+    Handles both string content and JSON dictionaries; dictionaries are
+    serialized with orjson when installed (UTF-8 only), stdlib json otherwise.
 
     Args:
         file_path: Path to write to
@@ -148,12 +211,35 @@ def safe_write(
     path = Path(file_path)
     ensure_dir(path.parent)
 
+    data = None
     if isinstance(content, dict):
-        with open(path, "w", encoding=encoding) as f:
-            json.dump(content, f, indent=2, default=str, ensure_ascii=False)
+        if HAS_ORJSON and encoding.lower().replace("-", "") == "utf8":
+            try:
+                data = orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
+            except TypeError:
+                data = None  # e.g. integers beyond 64 bits; use stdlib json
+        if data is None:
+            data = json.dumps(
+                content, indent=2, default=str, ensure_ascii=False
+            ).encode(encoding)
     else:
-        with open(path, "w", encoding=encoding) as f:
-            f.write(content)
+        data = content.encode(encoding)
+
+    # Write with raw syscalls, bypassing the text I/O stack
+    data = memoryview(data)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileNotFoundError:
+        # Parent was removed after ensure_dir remembered it; recreate and retry
+        _ENSURED_DIRS.discard(str(path.parent))
+        ensure_dir(path.parent)
+        fd = os.open(path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
     return path
 
@@ -18,5 +18,6 @@ Test markers:
 - @pytest.mark.unit: Unit tests
 - @pytest.mark.integration: Integration tests
 - @pytest.mark.e2e: End-to-end tests (skipped by default)
+- @pytest.mark.slow: Disk-heavy tests (skipped unless --run-slow is passed)
 """
 # UC-1.1 | PLAN-2.2
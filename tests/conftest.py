@@ -8,6 +8,9 @@ Shared pytest fixtures for GitHub Activity Report Generator tests.  # UC-13.1, U
 
 This module provides common fixtures used across unit, integration, and e2e tests:
 
+Options:
+- --run-slow: Also run tests marked @pytest.mark.slow
+
 Fixtures:
 - sample_config: Sample configuration Settings object
 - mock_github_client: Mock GitHubClient fixture
@@ -20,10 +23,12 @@ Fixtures:
 - temp_cache_dir: Temporary cache directory
 - temp_reports_dir: Temporary reports directory
 - valid_report_data: Valid report data matching schema
+- valid_report_json: Valid report data as a JSON string
 - minimal_report_data: Minimal valid report data
 """
 from __future__ import annotations
 
+import copy
 import json
 import sys
 import tempfile
@@ -40,23 +45,52 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 
+# =============================================================================
+# Markers & Options  # UC-13.1, UC-13.2 | PLAN-4
+# =============================================================================
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add --run-slow option to include tests marked slow."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked with @pytest.mark.slow",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register custom markers."""
+    config.addinivalue_line("markers", "slow: disk-heavy test, skipped unless --run-slow is passed")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip slow tests unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 # =============================================================================
 # Directory Fixtures  # UC-13.1, UC-13.2 | PLAN-4
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Path to test fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_responses_dir(fixtures_dir: Path) -> Path:
     """Path to API responses fixtures directory."""
     return fixtures_dir / "api_responses"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def expected_outputs_dir(fixtures_dir: Path) -> Path:
     """Path to expected outputs fixtures directory."""
     return fixtures_dir / "expected_outputs"
@@ -107,7 +141,7 @@ def sample_events(api_responses_dir: Path) -> list[dict[str, Any]]:
     return []
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_commits(api_responses_dir: Path) -> list[dict[str, Any]]:
     """Load sample commits from fixture file."""
     commits_file = api_responses_dir / "commits.json"
@@ -117,7 +151,7 @@ def sample_commits(api_responses_dir: Path) -> list[dict[str, Any]]:
     return []
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pull_requests(api_responses_dir: Path) -> list[dict[str, Any]]:
     """Load sample pull requests from fixture file."""
     prs_file = api_responses_dir / "pull_requests.json"
@@ -127,7 +161,7 @@ def sample_pull_requests(api_responses_dir: Path) -> list[dict[str, Any]]:
     return []
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_issues(api_responses_dir: Path) -> list[dict[str, Any]]:
     """Load sample issues from fixture file."""
     issues_file = api_responses_dir / "issues.json"
@@ -137,7 +171,7 @@ def sample_issues(api_responses_dir: Path) -> list[dict[str, Any]]:
     return []
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_reviews(api_responses_dir: Path) -> list[dict[str, Any]]:
     """Load sample reviews from fixture file."""
     reviews_file = api_responses_dir / "reviews.json"
@@ -161,9 +195,9 @@ def sample_report(expected_outputs_dir: Path) -> dict[str, Any]:
 # Configuration Fixtures  # UC-13.1, UC-13.2 | PLAN-4
 # =============================================================================
 
-@pytest.fixture
-def sample_config():
-    """Create a sample Settings configuration object."""
+@pytest.fixture(scope="session")
+def _sample_config_template():
+    """Build the sample Settings object once per session (do not mutate)."""
     from src.config.settings import (
         Settings, PeriodConfig, UserConfig, RepositoryConfig,
         CacheConfig, OutputConfig, MetricsConfig, LoggingConfig,
@@ -203,6 +237,12 @@ def sample_config():
     )
 
 
+@pytest.fixture
+def sample_config(_sample_config_template):
+    """Create a sample Settings configuration object (safe to mutate per test)."""
+    return copy.deepcopy(_sample_config_template)
+
+
 @pytest.fixture
 def cache_config():
     """Create a sample CacheConfig."""
@@ -280,9 +320,8 @@ def empty_mock_github_client():
 # Report Data Fixtures  # UC-13.1, UC-13.2 | PLAN-4
 # =============================================================================
 
-@pytest.fixture
-def valid_report_data() -> dict[str, Any]:
-    """Create valid report data matching the schema."""
+def _build_valid_report_data() -> dict[str, Any]:
+    """Build a fresh valid report dict matching the schema."""
     return {
         "metadata": {
             "generated_at": "2024-12-31T23:59:59Z",
@@ -364,6 +403,18 @@ def valid_report_data() -> dict[str, Any]:
     }
 
 
+@pytest.fixture
+def valid_report_data() -> dict[str, Any]:
+    """Create valid report data matching the schema."""
+    return _build_valid_report_data()
+
+
+@pytest.fixture(scope="session")
+def valid_report_json() -> str:
+    """Valid report data serialized to JSON once per session."""
+    return json.dumps(_build_valid_report_data())
+
+
 @pytest.fixture
 def minimal_report_data() -> dict[str, Any]:
     """Create minimal valid report data with required fields only."""
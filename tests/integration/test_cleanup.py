@@ -21,9 +21,6 @@ import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.utils.log_cleanup import LogCleaner, cleanup_logs
 from src.utils.report_cleanup import ReportCleaner, cleanup_reports
 from src.config.settings import LogCleanupConfig, ReportCleanupConfig, ErrorLogCleanupConfig, ArchiveConfig
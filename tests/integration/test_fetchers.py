@@ -18,12 +18,8 @@ Tests:
 import pytest
 from datetime import date
 from unittest.mock import MagicMock, patch
-from pathlib import Path
 from typing import Any
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.fetchers.events import EventsFetcher
 from src.fetchers.commits import CommitsFetcher
 from src.fetchers.pull_requests import PullRequestsFetcher
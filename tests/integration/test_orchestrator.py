@@ -15,12 +15,8 @@ Tests:
 """
 import pytest
 from datetime import date
-from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.processors.aggregator import DataAggregator, AggregatedData
 
 
@@ -20,9 +20,6 @@ from datetime import date
 from pathlib import Path
 from typing import Any
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.reporters.json_report import JsonReporter
 from src.reporters.markdown_report import MarkdownReporter
 from src.reporters.validator import ReportValidator
@@ -17,13 +17,55 @@ import pytest
 from datetime import date
 from typing import Any
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.processors.aggregator import AggregatedData, DataAggregator
 
 
+# Shared, immutable inputs for AggregatedData count tests
+_TWO_COMMITS = (
+    {"sha": "abc123", "date": "2024-12-15"},
+    {"sha": "def456", "date": "2024-12-16"},
+)
+_THREE_PRS = (
+    {"number": 1, "created_at": "2024-12-15"},
+    {"number": 2, "created_at": "2024-12-16"},
+    {"number": 3, "created_at": "2024-12-17"},
+)
+_PRS_MERGED_MIX = (
+    {"number": 1, "merged_at": "2024-12-15T10:00:00Z"},
+    {"number": 2, "merged_at": None},
+    {"number": 3, "merged_at": "2024-12-16T10:00:00Z"},
+)
+_ISSUES_STATE_MIX = (
+    {"number": 1, "state": "closed"},
+    {"number": 2, "state": "open"},
+    {"number": 3, "state": "closed"},
+)
+_TWO_REPOS = ("org/repo1", "org/repo2")
+
+
+@pytest.fixture(scope="module")
+def full_aggregated_data() -> AggregatedData:
+    """AggregatedData with every activity type populated."""
+    return AggregatedData(
+        commits=[
+            {"sha": "abc", "date": "2024-12-15", "repository": "org/repo1"},
+            {"sha": "def", "date": "2024-12-15", "repository": "org/repo1"},
+            {"sha": "ghi", "date": "2024-12-16", "repository": "org/repo2"},
+        ],
+        pull_requests=[{"number": 1, "created_at": "2024-12-15", "merged_at": "2024-12-16", "repository": "org/repo1"}],
+        issues=[{"number": 1, "state": "open", "created_at": "2024-12-15", "repository": "org/repo1"}],
+        reviews=[{"pr_number": 1}],
+        comments=[{"id": 1, "created_at": "2024-12-15"}],
+        repositories=["org/repo1", "org/repo2"]
+    )
+
+
+@pytest.fixture(scope="module")
+def full_summary(full_aggregated_data: AggregatedData) -> dict[str, Any]:
+    """Summary of full_aggregated_data, computed once per module."""
+    return full_aggregated_data.get_summary()
+
+
 class TestAggregatedData:  # UC-13.1 | PLAN-4
     """Tests for AggregatedData dataclass."""
 
@@ -38,98 +80,34 @@ class TestAggregatedData:  # UC-13.1 | PLAN-4
         assert data.total_issues_closed == 0
         assert data.repos_contributed_to == 0
 
-    def test_total_commits_count(self):
-        """Test total_commits property."""
-        data = AggregatedData(commits=[
-            {"sha": "abc123", "date": "2024-12-15"},
-            {"sha": "def456", "date": "2024-12-16"},
-        ])
-
-        assert data.total_commits == 2
-
-    def test_total_prs_opened(self):
-        """Test total_prs_opened property."""
-        data = AggregatedData(pull_requests=[
-            {"number": 1, "created_at": "2024-12-15"},
-            {"number": 2, "created_at": "2024-12-16"},
-            {"number": 3, "created_at": "2024-12-17"},
-        ])
-
-        assert data.total_prs_opened == 3
-
-    def test_total_prs_merged(self):
-        """Test total_prs_merged counts only merged PRs."""
-        data = AggregatedData(pull_requests=[
-            {"number": 1, "merged_at": "2024-12-15T10:00:00Z"},
-            {"number": 2, "merged_at": None},
-            {"number": 3, "merged_at": "2024-12-16T10:00:00Z"},
-        ])
-
-        assert data.total_prs_merged == 2
-
-    def test_total_issues_closed(self):
-        """Test total_issues_closed counts only closed issues."""
-        data = AggregatedData(issues=[
-            {"number": 1, "state": "closed"},
-            {"number": 2, "state": "open"},
-            {"number": 3, "state": "closed"},
-        ])
-
-        assert data.total_issues_closed == 2
-        assert data.total_issues_opened == 3
-
-    def test_repos_contributed_to(self):
-        """Test repos_contributed_to count."""
-        data = AggregatedData(repositories=["org/repo1", "org/repo2"])
-
-        assert data.repos_contributed_to == 2
-
-    def test_get_summary(self):
-        """Test get_summary returns dict with all fields."""
-        data = AggregatedData(
-            commits=[{"sha": "abc", "date": "2024-12-15", "repository": "org/repo1"}],
-            pull_requests=[{"number": 1, "created_at": "2024-12-15", "merged_at": "2024-12-16", "repository": "org/repo1"}],
-            issues=[{"number": 1, "state": "open", "created_at": "2024-12-15", "repository": "org/repo1"}],
-            reviews=[{"pr_number": 1}],
-            comments=[{"id": 1, "created_at": "2024-12-15"}],
-            repositories=["org/repo1"]
-        )
-
-        summary = data.get_summary()
-
-        assert "total_commits" in summary
-        assert "total_prs_opened" in summary
-        assert "total_prs_merged" in summary
-        assert "total_issues_opened" in summary
-        assert "total_issues_closed" in summary
-        assert "repos_contributed_to" in summary
-        assert summary["total_commits"] == 1
-
-    def test_most_active_day(self):
-        """Test most active day calculation."""
-        data = AggregatedData(
-            commits=[
-                {"date": "2024-12-15"},
-                {"date": "2024-12-15"},
-                {"date": "2024-12-16"},
-            ]
-        )
-
-        summary = data.get_summary()
-        assert summary["most_active_day"] == "2024-12-15"
-
-    def test_most_active_repo(self):
-        """Test most active repository calculation."""
-        data = AggregatedData(
-            commits=[
-                {"repository": "org/repo1"},
-                {"repository": "org/repo1"},
-                {"repository": "org/repo2"},
-            ]
-        )
-
-        summary = data.get_summary()
-        assert summary["most_active_repo"] == "org/repo1"
+    @pytest.mark.parametrize("kwargs, attr, expected", [
+        ({"commits": _TWO_COMMITS}, "total_commits", 2),
+        ({"pull_requests": _THREE_PRS}, "total_prs_opened", 3),
+        ({"pull_requests": _PRS_MERGED_MIX}, "total_prs_merged", 2),
+        ({"issues": _ISSUES_STATE_MIX}, "total_issues_closed", 2),
+        ({"issues": _ISSUES_STATE_MIX}, "total_issues_opened", 3),
+        ({"repositories": _TWO_REPOS}, "repos_contributed_to", 2),
+    ])
+    def test_count_properties(self, kwargs: dict[str, Any], attr: str, expected: int):
+        """Test count properties (commits, PRs opened/merged, issues, repos)."""
+        data = AggregatedData(**{name: list(items) for name, items in kwargs.items()})
+        assert getattr(data, attr) == expected
+
+    @pytest.mark.parametrize("key, expected", [
+        ("total_commits", 3),
+        ("total_prs_opened", 1),
+        ("total_prs_merged", 1),
+        ("total_prs_reviewed", 1),
+        ("total_issues_opened", 1),
+        ("total_issues_closed", 0),
+        ("total_comments", 1),
+        ("repos_contributed_to", 2),
+        ("most_active_day", "2024-12-15"),
+        ("most_active_repo", "org/repo1"),
+    ])
+    def test_get_summary(self, full_summary: dict[str, Any], key: str, expected: Any):
+        """Test get_summary fields, including most active day and repository."""
+        assert full_summary[key] == expected
 
 
 class TestDataAggregator:  # UC-13.1 | PLAN-4
@@ -246,12 +224,14 @@ class TestDataAggregator:  # UC-13.1 | PLAN-4
 
         assert len(breakdown) == 2
 
-        repo1 = next(r for r in breakdown if r["name"] == "org/repo1")
+        by_name = {r["name"]: r for r in breakdown}
+
+        repo1 = by_name["org/repo1"]
         assert repo1["commits"] == 2
         assert repo1["prs"] == 1
         assert repo1["issues"] == 0
 
-        repo2 = next(r for r in breakdown if r["name"] == "org/repo2")
+        repo2 = by_name["org/repo2"]
         assert repo2["commits"] == 1
         assert repo2["issues"] == 1
 
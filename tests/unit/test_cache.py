@@ -15,40 +15,50 @@ Tests:
 """
 import pytest
 import json
+import shutil
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.utils.cache import ResponseCache, create_cache
 from src.config.settings import CacheConfig
 
+# MD5 hex digest of "old_key", as produced by ResponseCache._get_cache_path
+_OLD_KEY_HASH = "919ccd0afc12c9e54e1e64d33275e315"
 
-class TestResponseCache:  # UC-13.1 | PLAN-4
-    """Tests for ResponseCache class."""
 
-    @pytest.fixture
-    def cache(self, temp_cache_dir: Path):
-        """Create a ResponseCache instance with temp directory."""
-        config = CacheConfig(
-            enabled=True,
-            directory=str(temp_cache_dir),
-            ttl_hours=24
-        )
-        return ResponseCache(config)
+@pytest.fixture(scope="module")
+def cache(tmp_path_factory: pytest.TempPathFactory) -> ResponseCache:
+    """Create a ResponseCache instance shared across the module."""
+    config = CacheConfig(
+        enabled=True,
+        directory=str(tmp_path_factory.mktemp("cache")),
+        ttl_hours=24
+    )
+    return ResponseCache(config)
+
+
+@pytest.fixture(scope="module")
+def disabled_cache(tmp_path_factory: pytest.TempPathFactory) -> ResponseCache:
+    """Create a disabled ResponseCache instance shared across the module."""
+    config = CacheConfig(
+        enabled=False,
+        directory=str(tmp_path_factory.mktemp("disabled_cache")),
+        ttl_hours=24
+    )
+    return ResponseCache(config)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(cache: ResponseCache):
+    """Reset the shared cache directory after each test to keep tests isolated."""
+    yield
+    shutil.rmtree(cache.cache_dir, ignore_errors=True)
+    cache.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    @pytest.fixture
-    def disabled_cache(self, temp_cache_dir: Path):
-        """Create a disabled ResponseCache instance."""
-        config = CacheConfig(
-            enabled=False,
-            directory=str(temp_cache_dir),
-            ttl_hours=24
-        )
-        return ResponseCache(config)
+
+class TestResponseCache:  # UC-13.1 | PLAN-4
+    """Tests for ResponseCache class."""
 
     def test_init_creates_directory(self, temp_dir: Path):
         """Test that initialization creates cache directory."""
@@ -93,10 +103,10 @@ class TestResponseCache:  # UC-13.1 | PLAN-4
         result = disabled_cache.get("test_key")
         assert result is None
 
-    def test_get_disabled(self, disabled_cache, temp_cache_dir: Path):
+    def test_get_disabled(self, disabled_cache):
         """Test get returns None when disabled."""
         # Manually create a cache file
-        cache_file = temp_cache_dir / "abc123.json"
+        cache_file = disabled_cache.cache_dir / "abc123.json"
         cache_file.write_text('{"data": "test"}')
 
         result = disabled_cache.get("any_key")
@@ -105,18 +115,53 @@ class TestResponseCache:  # UC-13.1 | PLAN-4
     def test_delete_existing(self, cache):
         """Test deleting existing cache entry."""
         cache.set("test_key", {"data": "test"})
-        assert cache.get("test_key") is not None
+        assert "test_key" in cache._mem
 
         result = cache.delete("test_key")
 
         assert result is True
+        assert "test_key" not in cache._mem
+        assert cache.get("test_key") is None
+
+    def test_set_mirrors_entry_in_memory(self, cache):
+        """Test set stores the entry in the in-memory mirror."""
+        data = {"key": "value"}
+        cache.set("test_key", data)
+
+        assert cache._mem["test_key"][1] == data
+        assert cache.get("test_key") is data
+
+    def test_get_ignores_memory_when_file_removed(self, cache):
+        """Test mirrored entries are not served once the file is gone."""
+        cache.set("test_key", {"data": "test"})
+        cache._get_cache_path("test_key").unlink()
+
         assert cache.get("test_key") is None
+        assert "test_key" not in cache._mem
+
+    def test_get_rereads_file_changed_on_disk(self, cache):
+        """Test mirrored entries are refreshed when the file changes."""
+        cache.set("test_key", {"data": "old"})
+        cache._get_cache_path("test_key").write_text('{"data": "newer"}')
+
+        assert cache.get("test_key") == {"data": "newer"}
+
+    def test_set_and_get_without_orjson(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test the stdlib json fallback round-trips data."""
+        monkeypatch.setattr("src.utils.cache.HAS_ORJSON", False)
+        config = CacheConfig(enabled=True, directory=str(tmp_path / "cache"), ttl_hours=24)
+        data = {"key": "välue", "list": [1, 2, 3]}
+
+        ResponseCache(config).set("test_key", data)
+
+        assert ResponseCache(config).get("test_key") == data
 
     def test_delete_nonexistent(self, cache):
         """Test deleting non-existent entry."""
         result = cache.delete("nonexistent")
         assert result is False
 
+    @pytest.mark.slow
     def test_clear(self, cache):
         """Test clearing all cache entries."""
         cache.set("key1", {"data": 1})
@@ -144,15 +189,13 @@ class TestResponseCache:  # UC-13.1 | PLAN-4
         cache.set("fresh_key", {"data": "test"})
         assert cache.is_expired("fresh_key") is False
 
-    def test_cleanup_expired(self, cache, temp_cache_dir: Path):
+    @pytest.mark.slow
+    def test_cleanup_expired(self, cache):
         """Test cleanup_expired removes old entries."""
         cache.set("key1", {"data": 1})
 
         # Manually create an old cache file
-        import hashlib
-        old_key = "old_key"
-        key_hash = hashlib.md5(old_key.encode()).hexdigest()
-        old_file = temp_cache_dir / f"{key_hash}.json"
+        old_file = cache.cache_dir / f"{_OLD_KEY_HASH}.json"
         old_file.write_text('{"data": "old"}')
 
         # Modify the mtime to be older than TTL
@@ -171,16 +214,6 @@ class TestResponseCache:  # UC-13.1 | PLAN-4
 class TestCacheKeyGeneration:  # UC-13.1 | PLAN-4
     """Tests for cache key generation."""
 
-    @pytest.fixture
-    def cache(self, temp_cache_dir: Path):
-        """Create a ResponseCache instance."""
-        config = CacheConfig(
-            enabled=True,
-            directory=str(temp_cache_dir),
-            ttl_hours=24
-        )
-        return ResponseCache(config)
-
     def test_get_cache_key_simple(self, cache):
         """Test simple cache key generation."""
         key = cache.get_cache_key("/users/events")
@@ -208,16 +241,6 @@ class TestCacheKeyGeneration:  # UC-13.1 | PLAN-4
 class TestCacheStats:  # UC-13.1 | PLAN-4
     """Tests for cache statistics."""
 
-    @pytest.fixture
-    def cache(self, temp_cache_dir: Path):
-        """Create a ResponseCache instance."""
-        config = CacheConfig(
-            enabled=True,
-            directory=str(temp_cache_dir),
-            ttl_hours=24
-        )
-        return ResponseCache(config)
-
     def test_get_stats_empty(self, cache):
         """Test stats for empty cache."""
         stats = cache.get_stats()
@@ -226,6 +249,7 @@ class TestCacheStats:  # UC-13.1 | PLAN-4
         assert stats["total_entries"] == 0
         assert stats["total_size_bytes"] == 0
 
+    @pytest.mark.slow
     def test_get_stats_with_entries(self, cache):
         """Test stats with cache entries."""
         cache.set("key1", {"data": "test1"})
@@ -238,11 +262,11 @@ class TestCacheStats:  # UC-13.1 | PLAN-4
         assert stats["valid_entries"] == 2
         assert stats["expired_entries"] == 0
 
-    def test_get_stats_disabled(self, temp_cache_dir: Path):
+    def test_get_stats_disabled(self, tmp_path: Path):
         """Test stats for disabled cache."""
         config = CacheConfig(
             enabled=False,
-            directory=str(temp_cache_dir),
+            directory=str(tmp_path / "cache"),
             ttl_hours=24
         )
         cache = ResponseCache(config)
@@ -256,11 +280,11 @@ class TestCacheStats:  # UC-13.1 | PLAN-4
 class TestCreateCache:  # UC-13.1 | PLAN-4
     """Tests for create_cache factory function."""
 
-    def test_creates_response_cache(self, temp_cache_dir: Path):
+    def test_creates_response_cache(self, tmp_path: Path):
         """Test factory creates ResponseCache instance."""
         config = CacheConfig(
             enabled=True,
-            directory=str(temp_cache_dir),
+            directory=str(tmp_path / "cache"),
             ttl_hours=12
         )
 
@@ -14,10 +14,6 @@ Tests:
 import pytest
 from datetime import date
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.utils.date_utils import (
     get_period_range,
     parse_period,
@@ -27,6 +23,7 @@ from src.utils.date_utils import (
     format_period,
     get_period_dates_str,
     is_within_range,
+    is_within_range_ordinals,
     parse_iso_datetime,
     parse_iso_date,
 )
@@ -201,6 +198,17 @@ class TestGetPeriodDatesStr:  # UC-13.1 | PLAN-4
         assert start == "2024-10-01"
         assert end == "2024-12-31"
 
+    @pytest.mark.parametrize("year, expected_end", [
+        (1900, "1900-02-28"),  # Century, not divisible by 400
+        (2000, "2000-02-29"),  # Divisible by 400
+        (2100, "2100-02-28"),
+    ])
+    def test_february_century_years(self, year: int, expected_end: str):
+        """Test February end date follows the Gregorian century rule."""
+        start, end = get_period_dates_str(year, "monthly", 2)
+        assert start == f"{year}-02-01"
+        assert end == expected_end
+
 
 class TestIsWithinRange:  # UC-13.1 | PLAN-4
     """Tests for is_within_range function."""
@@ -253,6 +261,15 @@ class TestIsWithinRange:  # UC-13.1 | PLAN-4
             date(2024, 12, 31)
         ) is True
 
+    def test_ordinals_match_date_check(self):
+        """Test ordinal variant agrees with date bounds, inclusive."""
+        start = date(2024, 12, 1).toordinal()
+        end = date(2024, 12, 31).toordinal()
+        assert is_within_range_ordinals(start, start, end) is True
+        assert is_within_range_ordinals(end, start, end) is True
+        assert is_within_range_ordinals(start - 1, start, end) is False
+        assert is_within_range_ordinals(end + 1, start, end) is False
+
     def test_invalid_string_returns_false(self):
         """Test invalid string returns False."""
         assert is_within_range(
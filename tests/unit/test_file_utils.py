@@ -16,9 +16,6 @@ import pytest
 import json
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.utils.file_utils import (
     ensure_dir,
     safe_write,
@@ -126,6 +123,32 @@ class TestSafeWrite:  # UC-13.1 | PLAN-4
         assert loaded == data
 
 
+    def test_writes_dict_as_json_without_orjson(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that the stdlib json fallback writes the same JSON."""
+        monkeypatch.setattr("src.utils.file_utils.HAS_ORJSON", False)
+        file_path = temp_dir / "fallback.json"
+        data = {"key": "value", "nested": {"number": 42}}
+
+        safe_write(file_path, data)
+
+        with open(file_path, "r") as f:
+            loaded = json.load(f)
+        assert loaded == data
+
+    def test_recreates_removed_parent_directory(self, temp_dir: Path):
+        """Test writing after a previously ensured directory was removed."""
+        file_path = temp_dir / "removed" / "test.txt"
+        safe_write(file_path, "First")
+        file_path.unlink()
+        file_path.parent.rmdir()
+
+        safe_write(file_path, "Second")
+
+        assert file_path.read_text() == "Second"
+
+
 class TestGetNextVersion:  # UC-13.1 | PLAN-4
     """Tests for get_next_version function."""
 
@@ -168,6 +191,14 @@ class TestGetNextVersion:  # UC-13.1 | PLAN-4
         result = get_next_version(temp_dir, "2024-12-github-activity", "json")
         assert result == 6  # Should use highest + 1
 
+    def test_compares_versions_numerically(self, temp_dir: Path):
+        """Test that version 10 is treated as newer than version 9."""
+        (temp_dir / "2024-12-github-activity-9.json").touch()
+        (temp_dir / "2024-12-github-activity-10.json").touch()
+
+        result = get_next_version(temp_dir, "2024-12-github-activity", "json")
+        assert result == 11
+
     def test_different_periods_independent(self, temp_dir: Path):
         """Test that different periods have independent versions."""
         # Create versions for different periods
@@ -18,10 +18,6 @@ import pytest
 from datetime import datetime
 from typing import Any
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.processors.metrics import (
     MetricsCalculator,
     PRMetrics,
@@ -29,6 +25,7 @@ from src.processors.metrics import (
     EngagementMetrics,
     ProductivityPatterns,
     ReactionBreakdown,
+    MetricsBatch,
     create_metrics_calculator,
 )
 from src.config.settings import MetricsConfig
@@ -60,6 +57,29 @@ class TestPRMetrics:  # UC-13.1 | PLAN-4
         assert result["prs_merged_without_changes"] == 3
 
 
+class TestMetricsBatch:  # UC-13.1 | PLAN-4
+    """Tests for MetricsBatch column rollups."""
+
+    def test_empty_batch(self):
+        """Test empty batch has no rows and zero mean."""
+        batch = MetricsBatch()
+
+        assert len(batch) == 0
+        assert batch.mean("avg_commits_per_pr") == 0.0
+
+    def test_from_records_rollups(self):
+        """Test mean/total across periods built from records."""
+        batch = MetricsBatch.from_records([
+            PRMetrics(avg_time_to_merge_hours=2.0, prs_merged_without_changes=1).to_record(),
+            PRMetrics(avg_time_to_merge_hours=4.0, prs_merged_without_changes=3).to_record(),
+        ])
+        batch.append(PRMetrics(avg_time_to_merge_hours=6.0))
+
+        assert len(batch) == 3
+        assert batch.mean("avg_time_to_merge_hours") == 4.0
+        assert batch.total("prs_merged_without_changes") == 4.0
+
+
 class TestReviewMetrics:  # UC-13.1 | PLAN-4
     """Tests for ReviewMetrics dataclass."""
 
@@ -14,42 +14,100 @@ Tests:
 - Edge cases
 """
 import pytest
-import json
+import copy
+import os
 from pathlib import Path
 from typing import Any
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.reporters.validator import (
     ReportValidator,
     validate_report,
     validate_report_file,
 )
 
+# Keep this module on one xdist worker so the shared validator is built once
+pytestmark = pytest.mark.xdist_group("validator")
+
+
+# Optional metrics section merged into the valid report
+_METRICS_BLOCK = {
+    "pr_metrics": {
+        "avg_commits_per_pr": 2.5,
+        "avg_time_to_merge_hours": 24.0
+    }
+}
+
+# (mutation applied to a fresh valid report, expected error_index key)
+_INVALID_CASES = [
+    pytest.param(lambda d: d.pop("metadata"), "metadata", id="missing_metadata"),
+    pytest.param(lambda d: d.pop("summary"), "summary", id="missing_summary"),
+    pytest.param(lambda d: d.pop("activity"), "activity", id="missing_activity"),
+    pytest.param(
+        lambda d: d["metadata"]["user"].pop("login"),
+        "metadata.user.login",
+        id="missing_user_login",
+    ),
+    pytest.param(
+        lambda d: d["metadata"]["period"].update(type="weekly"),
+        "metadata.period.type",
+        id="invalid_period_type",
+    ),
+    pytest.param(
+        lambda d: d["summary"].update(total_commits="five"),
+        "summary.total_commits",
+        id="invalid_data_type",
+    ),
+]
+
+
+
+@pytest.fixture(scope="module")
+def validator() -> ReportValidator:
+    """Create one ReportValidator shared by the module (do not mutate)."""
+    return ReportValidator()
+
+
+@pytest.fixture(scope="class")
+def wrong_data_result(validator: ReportValidator) -> tuple[bool, list[str]]:
+    """Validate a structurally wrong report once per test class."""
+    return validator.validate({"something": "wrong"})
+
 
 class TestReportValidator:  # UC-13.1 | PLAN-4
     """Tests for ReportValidator class."""
 
-    @pytest.fixture
-    def validator(self):
-        """Create a ReportValidator instance."""
-        return ReportValidator()
-
     def test_init_with_default_schema(self):
         """Test initialization with default schema path."""
         validator = ReportValidator()
         assert validator.schema_path is not None
         assert validator.schema_path.name == "schema.json"
 
-    def test_init_with_custom_schema(self, temp_dir: Path):
+    def test_init_with_custom_schema(self, tmp_path: Path):
         """Test initialization with custom schema path."""
-        schema_path = temp_dir / "custom-schema.json"
+        schema_path = tmp_path / "custom-schema.json"
         schema_path.write_text('{"type": "object"}')
 
         validator = ReportValidator(schema_path=schema_path)
         assert validator.schema_path == schema_path
 
+    def test_instances_share_compiled_schema(self):
+        """Test that validators for the same schema file share the schema."""
+        first = ReportValidator()
+        second = ReportValidator()
+        assert first.schema is second.schema
+
+    def test_modified_schema_is_reloaded(self, tmp_path: Path):
+        """Test that an edited schema file is parsed again."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text('{"type": "object"}')
+        assert ReportValidator(schema_path=schema_path).schema == {"type": "object"}
+
+        schema_path.write_text('{"type": "object", "required": ["metadata"]}')
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert ReportValidator(schema_path=schema_path).schema["required"] == ["metadata"]
+
     def test_schema_property_loads_schema(self, validator):
         """Test that schema property loads the schema."""
         schema = validator.schema
@@ -63,6 +121,23 @@ class TestReportValidator:  # UC-13.1 | PLAN-4
         assert is_valid is True
         assert errors == []
 
+    def test_validate_does_not_modify_report(self, validator, valid_report_data):
+        """Test that validation (including the fast path) leaves data untouched."""
+        original = copy.deepcopy(valid_report_data)
+
+        validator.validate(valid_report_data)
+
+        assert valid_report_data == original
+
+    def test_validate_without_fast_path(
+        self, validator, valid_report_data, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that jsonschema alone gives the same result as the fast path."""
+        monkeypatch.setattr(validator, "_fast_validate", None)
+
+        assert validator.validate(valid_report_data) == (True, [])
+        assert validator.validate({"metadata": {}})[0] is False
+
     def test_validate_minimal_report(self, validator, minimal_report_data):
         """Test validation of minimal valid report."""
         is_valid, errors = validator.validate(minimal_report_data)
@@ -70,208 +145,43 @@ class TestReportValidator:  # UC-13.1 | PLAN-4
         assert is_valid is True
         assert errors == []
 
-    def test_validate_missing_metadata(self, validator):
-        """Test validation catches missing metadata."""
-        data = {
-            "summary": {
-                "total_commits": 0,
-                "total_prs_opened": 0,
-                "total_prs_merged": 0,
-                "total_issues_opened": 0,
-                "total_issues_closed": 0,
-                "repos_contributed_to": 0
-            },
-            "activity": {
-                "commits": [],
-                "pull_requests": [],
-                "issues": [],
-                "reviews": [],
-                "comments": [],
-                "repositories": []
-            }
-        }
+    @pytest.mark.parametrize("mutate, expected_key", _INVALID_CASES)
+    def test_validate_catches_invalid(
+        self, validator, valid_report_data, mutate, expected_key: str
+    ):
+        """Test that each invalid variant of a valid report is caught at its field."""
+        mutate(valid_report_data)
 
-        is_valid, errors = validator.validate(data)
+        is_valid, errors, error_index = validator.validate_with_index(valid_report_data)
 
         assert is_valid is False
-        assert any("metadata" in e.lower() for e in errors)
-
-    def test_validate_missing_summary(self, validator):
-        """Test validation catches missing summary."""
-        data = {
-            "metadata": {
-                "generated_at": "2024-12-31T00:00:00Z",
-                "user": {"login": "testuser"},
-                "period": {
-                    "type": "monthly",
-                    "year": 2024,
-                    "start_date": "2024-12-01",
-                    "end_date": "2024-12-31"
-                },
-                "schema_version": "1.0"
-            },
-            "activity": {
-                "commits": [],
-                "pull_requests": [],
-                "issues": [],
-                "reviews": [],
-                "comments": [],
-                "repositories": []
-            }
-        }
-
-        is_valid, errors = validator.validate(data)
+        assert expected_key in error_index
 
-        assert is_valid is False
-        assert any("summary" in e.lower() for e in errors)
-
-    def test_validate_missing_activity(self, validator):
-        """Test validation catches missing activity."""
-        data = {
-            "metadata": {
-                "generated_at": "2024-12-31T00:00:00Z",
-                "user": {"login": "testuser"},
-                "period": {
-                    "type": "monthly",
-                    "year": 2024,
-                    "start_date": "2024-12-01",
-                    "end_date": "2024-12-31"
-                },
-                "schema_version": "1.0"
-            },
-            "summary": {
-                "total_commits": 0,
-                "total_prs_opened": 0,
-                "total_prs_merged": 0,
-                "total_issues_opened": 0,
-                "total_issues_closed": 0,
-                "repos_contributed_to": 0
-            }
-        }
+    def test_error_index_keyed_by_field_path(self, validator, valid_report_data):
+        """Test that the error index uses dotted paths of offending fields."""
+        data = copy.deepcopy(valid_report_data)
+        data["summary"]["total_commits"] = "five"
+        del data["metadata"]["period"]["year"]
 
-        is_valid, errors = validator.validate(data)
+        is_valid, errors, error_index = validator.validate_with_index(data)
 
         assert is_valid is False
-        assert any("activity" in e.lower() for e in errors)
-
-    def test_validate_missing_user_login(self, validator):
-        """Test validation catches missing user.login."""
-        data = {
-            "metadata": {
-                "generated_at": "2024-12-31T00:00:00Z",
-                "user": {},  # Missing login
-                "period": {
-                    "type": "monthly",
-                    "year": 2024,
-                    "start_date": "2024-12-01",
-                    "end_date": "2024-12-31"
-                },
-                "schema_version": "1.0"
-            },
-            "summary": {
-                "total_commits": 0,
-                "total_prs_opened": 0,
-                "total_prs_merged": 0,
-                "total_issues_opened": 0,
-                "total_issues_closed": 0,
-                "repos_contributed_to": 0
-            },
-            "activity": {
-                "commits": [],
-                "pull_requests": [],
-                "issues": [],
-                "reviews": [],
-                "comments": [],
-                "repositories": []
-            }
-        }
+        assert set(error_index) == {"summary.total_commits", "metadata.period.year"}
+        assert sorted(errors) == sorted(e for msgs in error_index.values() for e in msgs)
 
-        is_valid, errors = validator.validate(data)
-
-        assert is_valid is False
-        assert any("login" in e.lower() for e in errors)
-
-    def test_validate_invalid_period_type(self, validator):
-        """Test validation catches invalid period type."""
-        data = {
-            "metadata": {
-                "generated_at": "2024-12-31T00:00:00Z",
-                "user": {"login": "testuser"},
-                "period": {
-                    "type": "weekly",  # Invalid
-                    "year": 2024,
-                    "start_date": "2024-12-01",
-                    "end_date": "2024-12-31"
-                },
-                "schema_version": "1.0"
-            },
-            "summary": {
-                "total_commits": 0,
-                "total_prs_opened": 0,
-                "total_prs_merged": 0,
-                "total_issues_opened": 0,
-                "total_issues_closed": 0,
-                "repos_contributed_to": 0
-            },
-            "activity": {
-                "commits": [],
-                "pull_requests": [],
-                "issues": [],
-                "reviews": [],
-                "comments": [],
-                "repositories": []
-            }
-        }
-
-        is_valid, errors = validator.validate(data)
-
-        assert is_valid is False
-
-    def test_validate_invalid_data_type(self, validator):
-        """Test validation catches invalid data types."""
-        data = {
-            "metadata": {
-                "generated_at": "2024-12-31T00:00:00Z",
-                "user": {"login": "testuser"},
-                "period": {
-                    "type": "monthly",
-                    "year": "2024",  # Should be integer
-                    "start_date": "2024-12-01",
-                    "end_date": "2024-12-31"
-                },
-                "schema_version": "1.0"
-            },
-            "summary": {
-                "total_commits": "five",  # Should be integer
-                "total_prs_opened": 0,
-                "total_prs_merged": 0,
-                "total_issues_opened": 0,
-                "total_issues_closed": 0,
-                "repos_contributed_to": 0
-            },
-            "activity": {
-                "commits": [],
-                "pull_requests": [],
-                "issues": [],
-                "reviews": [],
-                "comments": [],
-                "repositories": []
-            }
-        }
-
-        is_valid, errors = validator.validate(data)
+    def test_validate_missing_sections_reported_by_name(self, validator):
+        """Test that each missing top-level section gets its own error."""
+        is_valid, errors = validator.validate({"metadata": {}})
 
         assert is_valid is False
+        assert errors == [
+            "Missing required field 'summary' at (root)",
+            "Missing required field 'activity' at (root)",
+        ]
 
     def test_validate_with_metrics(self, validator, valid_report_data):
         """Test validation with metrics section."""
-        data = valid_report_data.copy()
-        data["metrics"] = {
-            "pr_metrics": {
-                "avg_commits_per_pr": 2.5,
-                "avg_time_to_merge_hours": 24.0
-            }
-        }
+        data = valid_report_data | {"metrics": _METRICS_BLOCK}
 
         is_valid, errors = validator.validate(data)
 
@@ -281,10 +191,10 @@ class TestReportValidator:  # UC-13.1 | PLAN-4
 class TestValidateFile:  # UC-13.1 | PLAN-4
     """Tests for validate_file method."""
 
-    def test_validate_file_success(self, temp_dir: Path, valid_report_data):
+    def test_validate_file_success(self, tmp_path: Path, valid_report_json: str):
         """Test validating a valid JSON file."""
-        file_path = temp_dir / "report.json"
-        file_path.write_text(json.dumps(valid_report_data))
+        file_path = tmp_path / "report.json"
+        file_path.write_text(valid_report_json)
 
         validator = ReportValidator()
         is_valid, errors = validator.validate_file(file_path)
@@ -292,17 +202,17 @@ class TestValidateFile:  # UC-13.1 | PLAN-4
         assert is_valid is True
         assert errors == []
 
-    def test_validate_file_not_found(self, temp_dir: Path):
+    def test_validate_file_not_found(self, tmp_path: Path):
         """Test error for non-existent file."""
         validator = ReportValidator()
-        is_valid, errors = validator.validate_file(temp_dir / "nonexistent.json")
+        is_valid, errors = validator.validate_file(tmp_path / "nonexistent.json")
 
         assert is_valid is False
         assert any("not found" in e.lower() for e in errors)
 
-    def test_validate_file_not_json_extension(self, temp_dir: Path):
+    def test_validate_file_not_json_extension(self, tmp_path: Path):
         """Test error for non-JSON file."""
-        file_path = temp_dir / "report.txt"
+        file_path = tmp_path / "report.txt"
         file_path.write_text("{}")
 
         validator = ReportValidator()
@@ -311,9 +221,9 @@ class TestValidateFile:  # UC-13.1 | PLAN-4
         assert is_valid is False
         assert any("json" in e.lower() for e in errors)
 
-    def test_validate_file_invalid_json(self, temp_dir: Path):
+    def test_validate_file_invalid_json(self, tmp_path: Path):
         """Test error for invalid JSON content."""
-        file_path = temp_dir / "report.json"
+        file_path = tmp_path / "report.json"
         file_path.write_text("not valid json {{{")
 
         validator = ReportValidator()
@@ -323,6 +233,24 @@ class TestValidateFile:  # UC-13.1 | PLAN-4
         assert any("invalid json" in e.lower() for e in errors)
 
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_validate_bytes(
+        self, valid_report_json: str, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test validating serialized report bytes with either JSON parser."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr("src.reporters.validator.HAS_ORJSON", use_orjson)
+        validator = ReportValidator()
+
+        assert validator.validate_bytes(valid_report_json.encode()) == (True, [])
+
+        for raw in (b"not valid json {{{", b"", b"\xff\xfe"):
+            is_valid, errors = validator.validate_bytes(raw)
+            assert is_valid is False
+            assert any("invalid json" in e.lower() for e in errors)
+
+
 class TestConvenienceFunctions:  # UC-13.1 | PLAN-4
     """Tests for convenience functions."""
 
@@ -333,10 +261,10 @@ class TestConvenienceFunctions:  # UC-13.1 | PLAN-4
         assert is_valid is True
         assert errors == []
 
-    def test_validate_report_file_function(self, temp_dir: Path, valid_report_data):
+    def test_validate_report_file_function(self, tmp_path: Path, valid_report_json: str):
         """Test validate_report_file convenience function."""
-        file_path = temp_dir / "report.json"
-        file_path.write_text(json.dumps(valid_report_data))
+        file_path = tmp_path / "report.json"
+        file_path.write_text(valid_report_json)
 
         is_valid, errors = validate_report_file(file_path)
 
@@ -347,26 +275,21 @@ class TestConvenienceFunctions:  # UC-13.1 | PLAN-4
 class TestErrorMessages:  # UC-13.1 | PLAN-4
     """Tests for error message formatting."""
 
-    def test_error_message_includes_path(self):
+    def test_error_message_includes_path(self, wrong_data_result):
         """Test that error messages include field path."""
-        validator = ReportValidator()
-        data = {"metadata": {}}  # Missing required fields
-
-        is_valid, errors = validator.validate(data)
+        is_valid, errors = wrong_data_result
 
         assert is_valid is False
         # Check for path-like information in errors
         assert len(errors) > 0
+        assert all(" at " in e for e in errors)
 
-    def test_error_message_is_human_readable(self):
+    def test_error_message_is_human_readable(self, wrong_data_result):
         """Test that error messages are human-readable."""
-        validator = ReportValidator()
-        data = {"something": "wrong"}
-
-        is_valid, errors = validator.validate(data)
+        is_valid, errors = wrong_data_result
 
         assert is_valid is False
         # All errors should be strings
-        assert all(isinstance(e, str) for e in errors)
+        assert set(map(type, errors)) == {str}
         # No error should be empty
-        assert all(len(e) > 0 for e in errors)
+        assert "" not in errors